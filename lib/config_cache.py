@@ -0,0 +1,126 @@
+"""On-disk cache of parsed configuration files.
+
+Parsing YAML is the dominant cost of loading ``config.yaml``. After the first
+parse, :func:`load_cached` stores the result in a pickle sidecar next to the
+source (``config.yaml`` -> ``config.yaml.pkl``) tagged with the source's
+modification time and size. Later processes unpickle the sidecar instead of
+parsing, and fall back to YAML whenever the tag no longer matches.
+
+Unpickling runs code, so a sidecar is only loaded when it is a regular file
+owned by the current user and not writable by group or others; sidecars are
+written with mode ``0600``. Callers should still enable the sidecar only for
+files in directories they control (``project_utils.load_config`` uses it for
+the repository ``config.yaml`` alone), never for files in shared locations
+such as ``/tmp``.
+
+Example:
+    >>> config = load_cached(Path("config.yaml"))  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import stat as stat_module
+from pathlib import Path
+from typing import Any
+
+SIDECAR_SUFFIX = ".pkl"
+
+# Bump when the sidecar layout changes so old files are ignored.
+_FORMAT_VERSION = 1
+
+
+def sidecar_path(config_path: Path) -> Path:
+    """Return the pickle sidecar location for ``config_path``."""
+    return config_path.with_name(config_path.name + SIDECAR_SUFFIX)
+
+
+def load_cached(
+    config_path: Path, stat: os.stat_result | None = None, *, sidecar: bool = True
+) -> Any:
+    """Load a YAML file, reusing a fresh pickle sidecar when one exists.
+
+    Args:
+        config_path: YAML file to load.
+        stat: ``os.stat`` result for ``config_path`` if the caller already
+            has one, saving a syscall.
+        sidecar: If False, parse the YAML without reading or writing a
+            sidecar, leaving nothing behind on disk.
+
+    Returns:
+        The parsed YAML document.
+
+    Raises:
+        FileNotFoundError: If ``config_path`` does not exist.
+        yaml.YAMLError: If the YAML cannot be parsed.
+    """
+    if not sidecar:
+        return _parse(config_path)
+
+    if stat is None:
+        stat = config_path.stat()
+    tag = (_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size)
+    path = sidecar_path(config_path)
+
+    try:
+        cached_tag, data = pickle.loads(_read_sidecar(path))
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+    else:
+        if cached_tag == tag:
+            return data
+
+    data = _parse(config_path)
+    _write_sidecar(path, tag, data)
+    return data
+
+
+def _parse(config_path: Path) -> Any:
+    """Parse ``config_path`` as YAML."""
+    # Imported here so a sidecar hit never pays for importing PyYAML.
+    from fast_yaml import load_yaml
+
+    # Hand the binary handle straight to the loader: libyaml reads from the
+    # stream and detects the encoding itself, avoiding a decoded copy.
+    with config_path.open("rb") as handle:
+        return load_yaml(handle)
+
+
+def _read_sidecar(sidecar: Path) -> bytes:
+    """Return the sidecar's bytes if it is safe to unpickle.
+
+    Raises:
+        OSError: If the sidecar is missing, is not a regular file, is owned
+            by another user, or is writable by group or others.
+    """
+    with sidecar.open("rb") as handle:
+        # fstat the open handle so the checked file is the one that is read.
+        info = os.fstat(handle.fileno())
+        if not stat_module.S_ISREG(info.st_mode):
+            raise OSError(f"{sidecar} is not a regular file")
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            raise OSError(f"{sidecar} is owned by another user")
+        if info.st_mode & (stat_module.S_IWGRP | stat_module.S_IWOTH):
+            raise OSError(f"{sidecar} is writable by group or others")
+        return handle.read()
+
+
+def _write_sidecar(sidecar: Path, tag: tuple[int, int, int], data: Any) -> None:
+    """Atomically write the sidecar; failures only cost the next parse."""
+    temp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        # O_EXCL refuses a pre-existing temp file or symlink; 0600 keeps the
+        # sidecar loadable by the ownership and permission checks.
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(pickle.dumps((tag, data), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(temp, sidecar)
+    except OSError:
+        try:
+            temp.unlink()
+        except OSError:
+            pass
+
+
+__all__ = ["SIDECAR_SUFFIX", "load_cached", "sidecar_path"]
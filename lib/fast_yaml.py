@@ -0,0 +1,41 @@
+"""Fast YAML parsing for configuration files.
+
+Selects the quickest safe loader available: PyYAML's libyaml-backed
+``CSafeLoader`` when PyYAML was built against libyaml, otherwise the
+pure-Python ``SafeLoader``. Both construct only standard YAML tags, so the
+result is identical to :func:`yaml.safe_load`.
+
+Example:
+    >>> load_yaml(b"weekly_planner:\\n  max_estimate_hours: 8\\n")
+    {'weekly_planner': {'max_estimate_hours': 8}}
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as Loader
+
+
+def load_yaml(stream: IO[bytes] | IO[str] | bytes | str) -> Any:
+    """Parse a single YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML source. Binary file handles are preferred: libyaml reads
+            them directly and detects the encoding itself.
+
+    Returns:
+        The parsed document, or ``None`` for an empty document.
+
+    Raises:
+        yaml.YAMLError: If the YAML cannot be parsed.
+    """
+    return yaml.load(stream, Loader=Loader)
+
+
+__all__ = ["Loader", "load_yaml"]
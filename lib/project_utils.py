@@ -7,15 +7,61 @@ priority formatting needed by the current test suite.
 
 from __future__ import annotations
 
+import functools
+import os
+import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
+from config_cache import load_cached
+
+# The only file whose parse is persisted in a pickle sidecar: it lives in the
+# repository checkout, a directory the user controls. Other configs may sit in
+# shared locations and are parsed without writing anything next to them.
+_SIDECAR_CONFIG = os.path.abspath(Path(__file__).parent.parent / "config.yaml")
+
+# Parsed configurations keyed by absolute path, stored with the mtime (in ns)
+# they were parsed at. Editing the file changes its mtime, so a stale entry is
+# never returned and is replaced by the fresh parse.
+_CONFIG_CACHE: dict[str, tuple[int, dict[str, Any]]] = {}
+# Distinct files kept; the oldest entry is evicted beyond this.
+_CONFIG_CACHE_SIZE = 64
+
+_PRIORITY_EMOJIS = {
+    "critical": "🔥",
+    "high": "⬆️",
+    "medium": "➡️",
+    "low": "⬇️",
+}
+
+
+def _intern_keys(node: Any) -> Any:
+    """Intern string mapping keys throughout a parsed YAML document.
+
+    The YAML loader allocates a fresh string for every key occurrence, so a
+    config with many projects holds one copy of ``"priority"`` per project.
+    Interning collapses the duplicates and lets lookups with literal keys
+    succeed on the identity check instead of a string comparison.
+    """
+    if isinstance(node, dict):
+        return {
+            (sys.intern(key) if isinstance(key, str) else key): _intern_keys(value)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_intern_keys(item) for item in node]
+    return node
 
 
 def load_config(config_path: str | Path) -> dict[str, Any]:
     """Load a YAML configuration file.
 
+    Parsed results are cached per file and modification time, so repeated
+    loads of an unchanged file skip the YAML parse. The returned dictionary
+    is shared between callers and must be treated as read-only. For the
+    repository ``config.yaml``, a pickle sidecar (``config.yaml.pkl``, see
+    :mod:`config_cache`) serves the same purpose across processes.
+
     Args:
         config_path: Path to the YAML configuration file.
 
@@ -23,17 +69,38 @@ def load_config(config_path: str | Path) -> dict[str, Any]:
         Parsed configuration as a dictionary.
 
     Raises:
-        FileNotFoundError: If ``path`` does not exist.
+        FileNotFoundError: If ``config_path`` does not exist.
         yaml.YAMLError: If YAML cannot be parsed.
     """
-    config_path = Path(path)
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    with config_path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
-
-
+    config_path = Path(config_path)
+    # One stat serves as both the existence check and the cache key; an
+    # exists() pre-check or resolve() would each cost extra syscalls.
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    absolute_path = os.path.abspath(config_path)
+    cached = _CONFIG_CACHE.get(absolute_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns:
+        return cached[1]
+
+    try:
+        config = _intern_keys(
+            load_cached(config_path, stat, sidecar=absolute_path == _SIDECAR_CONFIG) or {}
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    # Re-insert so the dict's order stays oldest-stored first.
+    _CONFIG_CACHE.pop(absolute_path, None)
+    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+        del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+    _CONFIG_CACHE[absolute_path] = (stat.st_mtime_ns, config)
+    return config
+
+
+@functools.lru_cache(maxsize=32)
 def get_priority_emoji(priority: str) -> str:
     """Return an emoji representing the provided priority level.
 
@@ -52,11 +119,4 @@ def get_priority_emoji(priority: str) -> str:
         '➡️'
     """
 
-    normalized = priority.strip().lower()
-    mapping = {
-        "critical": "🔥",
-        "high": "⬆️",
-        "medium": "➡️",
-        "low": "⬇️",
-    }
-    return mapping.get(normalized, "•")
+    return _PRIORITY_EMOJIS.get(priority.strip().lower(), "•")
@@ -18,30 +18,368 @@ Example:
 """
 from __future__ import annotations
 
+import functools
+import hashlib
 import re
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from project_utils import load_config
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; the ``re`` path is always available.
+    hyperscan = None
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+
+# Estimates are ASCII digits, so ``\d``/``\s``/``\w`` use the small ASCII
+# tables instead of Unicode property lookups. Case sensitivity stays under
+# the control of each configured pattern (e.g. a leading ``(?i)``).
+_PATTERN_FLAGS = re.ASCII
+
+# Captured hour strings for the common small values, mapped straight to ints
+# so the usual case skips int()'s general parser.
+_SMALL_HOURS = {str(hours): hours for hours in range(1, 100)}
+
+# Distinct bodies remembered per estimator. Issue corpora repeat templated
+# bodies ("No estimate", checklists) often enough to make this pay off.
+_ESTIMATE_CACHE_SIZE = 4096
+
+# Distinct pattern sets whose compiled form is kept. Processes normally use a
+# single configuration; a few extra slots cover tests and ad-hoc configs.
+_PATTERN_CACHE_SIZE = 8
+
+_BODY_KEY = "body"
+_ESTIMATED_HOURS_KEY = "estimated_hours"
+
+
+def _load_planner_config(config_path: str | Path | None) -> dict[str, Any]:
+    """Return the configuration used by :class:`TimeEstimator`.
+
+    For the default ``config.yaml``, the module generated by
+    ``scripts/compile_config.py`` is imported instead of parsing YAML, as long
+    as its recorded hash still matches the file on disk. Custom paths, a
+    missing compiled module, or a stale one all fall back to
+    :func:`project_utils.load_config`.
+    """
+    if config_path is None:
+        try:
+            from _config_compiled import _CONFIG, _SOURCE_SHA256
+        except ImportError:
+            pass
+        else:
+            try:
+                digest = hashlib.sha256(DEFAULT_CONFIG_PATH.read_bytes()).hexdigest()
+            except OSError:
+                digest = None
+            if digest == _SOURCE_SHA256:
+                return _CONFIG
+        config_path = DEFAULT_CONFIG_PATH
+
+    return load_config(config_path)
+
+
+def _build_hyperscan_database(pattern_strings: list[str]) -> Any | None:
+    """Compile the patterns into a Hyperscan multi-pattern database.
+
+    Pattern ids are the indexes into ``pattern_strings``. Returns ``None`` when
+    Hyperscan is not installed or rejects any of the patterns, for example
+    because it relies on Python-only regex syntax.
+    """
+    if hyperscan is None or not pattern_strings:
+        return None
+
+    # Without HS_FLAG_UCP, character classes are ASCII-only, as with re.ASCII.
+    flags = hyperscan.HS_FLAG_UTF8
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode("utf-8") for pattern in pattern_strings],
+            ids=list(range(len(pattern_strings))),
+            elements=len(pattern_strings),
+            flags=[flags] * len(pattern_strings),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+class _CompiledPatterns(NamedTuple):
+    """Compiled forms of the configured estimate patterns."""
+
+    patterns: tuple[re.Pattern[str], ...]
+    hyperscan: Any | None
+    # Per-thread scratch spaces for ``hyperscan``. A scratch space can only be
+    # used by one scan at a time, while the database itself is read-only.
+    hyperscan_scratch: threading.local
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _compile_patterns(pattern_strings: tuple[str, ...]) -> _CompiledPatterns:
+    """Compile ``pattern_strings`` for every matching strategy.
+
+    Cached on the pattern tuple, so estimators built from the same
+    configuration share one set of compiled regexes and Hyperscan database.
+    The result is treated as read-only by every caller; Hyperscan scans use
+    a scratch space private to the calling thread, so sharing is thread-safe.
+    """
+    return _CompiledPatterns(
+        patterns=tuple(re.compile(pattern, _PATTERN_FLAGS) for pattern in pattern_strings),
+        hyperscan=_build_hyperscan_database(list(pattern_strings)),
+        hyperscan_scratch=threading.local(),
+    )
+
+
+def _hyperscan_scratch(compiled: _CompiledPatterns) -> Any:
+    """Return the calling thread's scratch space for ``compiled.hyperscan``."""
+    local = compiled.hyperscan_scratch
+    scratch = getattr(local, "scratch", None)
+    if scratch is None:
+        scratch = local.scratch = hyperscan.Scratch(compiled.hyperscan)
+    return scratch
+
+
+def _hyperscan_first_index(compiled: _CompiledPatterns, text: str) -> int | None:
+    """Return the lowest pattern index Hyperscan reports for ``text``.
+
+    Hyperscan scans the body once for all patterns and reports match ids
+    but not capture groups, so the caller re-runs only the winning pattern
+    with ``re`` to read the hours.
+    """
+    lowest = len(compiled.patterns)
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+        nonlocal lowest
+        lowest = min(lowest, pattern_id)
+        return lowest == 0  # Nothing can beat the first pattern; stop scanning.
+
+    try:
+        compiled.hyperscan.scan(
+            text.encode("utf-8"),
+            match_event_handler=on_match,
+            scratch=_hyperscan_scratch(compiled),
+        )
+    except hyperscan.ScanTerminated:
+        pass
+    except (UnicodeEncodeError, hyperscan.error):
+        # Lone surrogates cannot be encoded, and any Hyperscan failure is
+        # recoverable: ``re`` gives the same answer.
+        return _regex_first_index(compiled, text)
+    return lowest if lowest < len(compiled.patterns) else None
+
+
+def _regex_first_index(compiled: _CompiledPatterns, text: str) -> int | None:
+    """Return the index of the first pattern that matches ``text``."""
+    for index, pattern in enumerate(compiled.patterns):
+        if pattern.search(text):
+            return index
+    return None
+
+
+def _regex_first_match(compiled: _CompiledPatterns, text: str) -> str | None:
+    """Find the first matching pattern using Python's ``re``.
+
+    Each pattern is searched separately, which keeps ``re``'s fast scan for
+    the pattern's literal prefix (``estimate:``, ``[``) instead of trying an
+    alternation at every position.
+    """
+    for pattern in compiled.patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _first_match(compiled: _CompiledPatterns, text: str) -> str | None:
+    """Return the hours captured by the first configured pattern that matches.
+
+    Patterns are tried in configuration order, so an earlier pattern wins even
+    when a later one matches closer to the start of ``text``.
+    """
+    if compiled.hyperscan is not None:
+        index = _hyperscan_first_index(compiled, text)
+        if index is None:
+            return None
+        match = compiled.patterns[index].search(text)
+        if match:
+            return match.group(1)
+        # The engines disagreed on this body; trust ``re``.
+    return _regex_first_match(compiled, text)
+
+
+def _normalize_hours(raw: str, default_hours: int, max_hours: int) -> int:
+    """Convert captured digits to hours, applying the default and maximum."""
+    normalized = _SMALL_HOURS.get(raw)
+    if normalized is None:
+        # abs() guards custom patterns that capture a sign, e.g. (-?\d+).
+        normalized = abs(int(raw))
+    if normalized == 0:
+        return default_hours
+
+    if normalized > max_hours:
+        return max_hours
+
+    return normalized
+
+
+def _estimate_text(
+    compiled: _CompiledPatterns, default_hours: int, max_hours: int, text: str
+) -> int:
+    """Estimate hours for a non-blank body."""
+    raw = _first_match(compiled, text)
+    if raw is None:
+        return default_hours
+    return _normalize_hours(raw, default_hours, max_hours)
+
+
+def _specialize_estimator(
+    compiled: _CompiledPatterns, default_hours: int, max_hours: int
+) -> Callable[[str], int]:
+    """Build a body estimator with the compiled state and bounds baked in.
+
+    For the common pure-``re`` setup this returns a closure that inlines
+    :func:`_regex_first_match` and :func:`_normalize_hours`: the bound search
+    methods and bounds are closure constants, so a call does no attribute
+    loads and no nested helper calls. The Hyperscan setup uses the generic
+    path.
+    """
+    if compiled.hyperscan is not None:
+        return functools.partial(_estimate_text, compiled, default_hours, max_hours)
+
+    searches = tuple(pattern.search for pattern in compiled.patterns)
+    small_hours = _SMALL_HOURS.get
+
+    def estimate(text: str) -> int:
+        for search in searches:
+            match = search(text)
+            if match:
+                break
+        else:
+            return default_hours
+
+        raw = match.group(1)
+        hours = small_hours(raw)
+        if hours is None:
+            hours = abs(int(raw))
+        if hours == 0:
+            return default_hours
+        return hours if hours < max_hours else max_hours
+
+    return estimate
+
 
 class TimeEstimator:
     """Parse and normalize time estimates from issue bodies.
 
     Patterns, defaults, and maximums are loaded from ``config.yaml`` under the
-    ``weekly_planner`` key. The patterns are compiled once during
-    initialization for efficient reuse.
+    ``weekly_planner`` key. The patterns are compiled once, on first use, and
+    reused for every later call.
+
+    Args:
+        config_path: Optional path to an alternative configuration file.
+            Defaults to the repository ``config.yaml``.
+
+    Raises:
+        ValueError: If ``default_estimate_hours`` exceeds
+            ``max_estimate_hours``.
     """
 
-    def __init__(self) -> None:
-        config_path = Path(__file__).parent.parent / "config.yaml"
-        config = load_config(config_path)
+    __slots__ = (
+        "_pattern_strings",
+        "_compiled",
+        "_estimate_cached",
+        "_default_hours",
+        "_max_hours",
+        "__weakref__",
+    )
+
+    def __init__(self, config_path: str | Path | None = None) -> None:
+        config = _load_planner_config(config_path)
         planner_config = config.get("weekly_planner", {})
 
-        pattern_strings = planner_config.get("estimate_patterns", [])
-        self.patterns = [re.compile(pattern) for pattern in pattern_strings]
-        self.default_hours = int(planner_config.get("default_estimate_hours", 1))
-        self.max_hours = int(planner_config.get("max_estimate_hours", 8))
+        self._configure(
+            tuple(planner_config.get("estimate_patterns", [])),
+            int(planner_config.get("default_estimate_hours", 1)),
+            int(planner_config.get("max_estimate_hours", 8)),
+        )
+
+    def _configure(
+        self, pattern_strings: tuple[str, ...], default_hours: int, max_hours: int
+    ) -> None:
+        """Store validated settings; compilation is deferred to first use."""
+        if default_hours > max_hours:
+            raise ValueError(
+                f"default_estimate_hours ({default_hours}) cannot exceed "
+                f"max_estimate_hours ({max_hours})"
+            )
+
+        self._pattern_strings = pattern_strings
+        self._compiled: _CompiledPatterns | None = None
+        self._estimate_cached: Callable[[str], int] | None = None
+        self._default_hours = default_hours
+        self._max_hours = max_hours
+
+    @classmethod
+    def _from_settings(
+        cls, pattern_strings: tuple[str, ...], default_hours: int, max_hours: int
+    ) -> TimeEstimator:
+        """Build an estimator from already-loaded settings, skipping config I/O."""
+        estimator = cls.__new__(cls)
+        estimator._configure(pattern_strings, default_hours, max_hours)
+        return estimator
+
+    def __reduce__(self) -> tuple[Callable[..., TimeEstimator], tuple[Any, ...]]:
+        """Pickle the settings only; compiled state is rebuilt on first use.
+
+        Keeps used estimators picklable (e.g. for ``ProcessPoolExecutor.map``)
+        even though the memoized closure and Hyperscan database are not.
+        """
+        return (
+            TimeEstimator._from_settings,
+            (self._pattern_strings, self._default_hours, self._max_hours),
+        )
+
+    @property
+    def default_hours(self) -> int:
+        """Hours returned when no estimate is found."""
+        return self._default_hours
+
+    @property
+    def max_hours(self) -> int:
+        """Upper bound applied to every estimate."""
+        return self._max_hours
+
+    @property
+    def patterns(self) -> list[re.Pattern[str]]:
+        """Compiled estimate patterns, in priority order."""
+        return list(self._compile().patterns)
+
+    def _compile(self) -> _CompiledPatterns:
+        """Return the compiled patterns, compiling them on first use."""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = _compile_patterns(self._pattern_strings)
+        return compiled
+
+    def _estimator(self) -> Callable[[str], int]:
+        """Return the memoized body estimator, creating it on first use.
+
+        The cache wraps a function specialized for the compiled patterns and
+        bounds only, so it holds no reference back to this instance.
+        """
+        estimate = self._estimate_cached
+        if estimate is None:
+            estimate = _specialize_estimator(
+                self._compile(), self._default_hours, self._max_hours
+            )
+            estimate = self._estimate_cached = functools.lru_cache(
+                maxsize=_ESTIMATE_CACHE_SIZE
+            )(estimate)
+        return estimate
 
     def extract_estimate(self, issue_body: str | None) -> int:
         """Extract an hour estimate from an issue body.
@@ -53,47 +391,110 @@ class TimeEstimator:
             Normalized hour estimate. Falls back to the configured default when
             no pattern matches or when invalid values are encountered.
         """
-        if issue_body is None:
-            return self.default_hours
-
-        text = issue_body.strip()
-        if not text:
-            return self.default_hours
+        # isspace() checks for a blank body without allocating a stripped copy.
+        if not issue_body or issue_body.isspace():
+            return self._default_hours
+        return self._estimator()(issue_body)
 
-        for pattern in self.patterns:
-            match = pattern.search(text)
-            if not match:
-                continue
-
-            value = int(match.group(1))
-            normalized = abs(value)
-            if normalized == 0:
-                return self.default_hours
-
-            if normalized > self.max_hours:
-                return self.max_hours
-
-            return normalized
-
-        return self.default_hours
-
-    def batch_extract(self, issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def batch_extract(
+        self, issues: Iterable[dict[str, Any]], *, workers: int = 1, in_place: bool = False
+    ) -> list[dict[str, Any]]:
         """Extract time estimates for a batch of issues.
 
         Args:
-            issues: List of issue dictionaries containing a ``body`` field.
+            issues: Issue dictionaries containing a ``body`` field. Any
+                iterable is accepted; it is consumed once.
+            workers: Number of worker processes. With more than one, the
+                bodies are split into chunks estimated in parallel; results
+                are identical to the single-process path.
+            in_place: If True, add ``estimated_hours`` to the given issue
+                dictionaries instead of copying them. A list passed as
+                ``issues`` is returned itself.
 
         Returns:
             New list of dictionaries, preserving the original fields and
-            adding ``estimated_hours`` for each issue.
+            adding ``estimated_hours`` for each issue (the updated input
+            dictionaries when ``in_place`` is set). Issues whose body is missing or not a
+            string get the default estimate.
+
+        Raises:
+            ValueError: If ``workers`` is less than 1.
         """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if not isinstance(issues, list):
+            issues = list(issues)
 
-        results: list[dict[str, Any]] = []
+        bodies: list[str | None] = []
+        add_body = bodies.append
         for issue in issues:
+            body = issue.get(_BODY_KEY)
+            add_body(body if isinstance(body, str) else None)
+
+        if workers > 1 and len(bodies) > workers:
+            estimates = self._parallel_estimates(bodies, workers)
+        else:
+            estimates = self._estimate_bodies(bodies)
+
+        if in_place:
+            for issue, estimated in zip(issues, estimates):
+                issue[_ESTIMATED_HOURS_KEY] = estimated
+            return issues
+
+        results: list[dict[str, Any]] = []
+        add_result = results.append
+        for issue, estimated in zip(issues, estimates):
             issue_copy = issue.copy()
-            issue_copy["estimated_hours"] = self.extract_estimate(issue.get("body"))
-            results.append(issue_copy)
+            issue_copy[_ESTIMATED_HOURS_KEY] = estimated
+            add_result(issue_copy)
         return results
 
+    def _parallel_estimates(self, bodies: list[str | None], workers: int) -> list[int]:
+        """Estimate ``bodies`` across a pool of worker processes.
+
+        Each worker builds its own estimator from this one's settings (compiled
+        regexes and Hyperscan databases are not shared across processes) and
+        estimates whole chunks, keeping the per-task overhead low.
+        """
+        chunk_size = -(-len(bodies) // (workers * 4))
+        chunks = [bodies[i:i + chunk_size] for i in range(0, len(bodies), chunk_size)]
+        settings = (self._pattern_strings, self._default_hours, self._max_hours)
+
+        estimates: list[int] = []
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=settings
+        ) as pool:
+            for part in pool.map(_worker_estimate_bodies, chunks):
+                estimates.extend(part)
+        return estimates
+
+    def _estimate_bodies(self, bodies: list[str | None]) -> list[int]:
+        """Estimate hours for many bodies, equal to :meth:`extract_estimate` on each.
+
+        Blank bodies get the default without a lookup; repeated bodies are
+        served by the memoized estimator.
+        """
+        estimate = self._estimator()
+        default_hours = self._default_hours
+        return [
+            default_hours if not body or body.isspace() else estimate(body)
+            for body in bodies
+        ]
+
+
+# Per-process estimator used by batch_extract(workers=...) pool workers.
+_worker_estimator: TimeEstimator | None = None
+
+
+def _init_worker(pattern_strings: tuple[str, ...], default_hours: int, max_hours: int) -> None:
+    """Create the worker process's estimator from the parent's settings."""
+    global _worker_estimator
+    _worker_estimator = TimeEstimator._from_settings(pattern_strings, default_hours, max_hours)
+
+
+def _worker_estimate_bodies(bodies: list[str | None]) -> list[int]:
+    """Estimate one chunk of bodies inside a worker process."""
+    return _worker_estimator._estimate_bodies(bodies)
+
 
 __all__ = ["TimeEstimator"]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pre-compile config.yaml into an importable Python module.
+
+Writes ``lib/_config_compiled.py`` containing the parsed configuration as a
+literal dict, so :class:`TimeEstimator` can import it instead of parsing YAML
+on every process start. Re-run this script after editing ``config.yaml``; a
+stale module is detected by content hash and ignored.
+
+Usage:
+    python3 scripts/compile_config.py [config.yaml]
+"""
+
+import ast
+import hashlib
+import pprint
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LIB_DIR = REPO_ROOT / 'lib'
+
+# Add lib to path so we can import from it
+if str(LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(LIB_DIR))
+
+from project_utils import load_config
+
+OUTPUT_PATH = LIB_DIR / '_config_compiled.py'
+
+TEMPLATE = '''"""Compiled copy of config.yaml. Generated by scripts/compile_config.py; do not edit."""
+
+_SOURCE_SHA256 = {digest!r}
+
+_CONFIG = {config}
+'''
+
+
+def compile_config(config_path: Path, output_path: Path = OUTPUT_PATH) -> Path:
+    """Write the parsed configuration at ``config_path`` to ``output_path``.
+
+    Args:
+        config_path: YAML configuration file to compile.
+        output_path: Destination Python module.
+
+    Returns:
+        The path of the generated module.
+
+    Raises:
+        ValueError: If the configuration contains values that cannot be
+            written as Python literals (for example unquoted YAML dates).
+    """
+    digest = hashlib.sha256(config_path.read_bytes()).hexdigest()
+    literal = pprint.pformat(load_config(config_path), sort_dicts=False)
+    try:
+        ast.literal_eval(literal)
+    except (ValueError, SyntaxError) as e:
+        raise ValueError(f"{config_path} cannot be compiled to Python literals: {e}") from None
+
+    output_path.write_text(TEMPLATE.format(digest=digest, config=literal), encoding='utf-8')
+    return output_path
+
+
+def main():
+    """Compile the config file given on the command line (default: config.yaml)."""
+    config_path = Path(sys.argv[1]) if len(sys.argv) > 1 else REPO_ROOT / 'config.yaml'
+    output_path = compile_config(config_path)
+    print(f"Compiled {config_path} -> {output_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
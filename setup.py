@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Optional native build of the hot library modules.
+
+Compiles ``lib/time_estimator.py`` with Cython into an extension module next
+to the source. Python prefers the compiled module when it is present; the
+``.py`` file stays the reference implementation and is used everywhere the
+extension has not been built. Rebuild, or delete the ``.so``, after editing
+the source, since a stale extension shadows the updated ``.py``.
+
+Usage:
+    pip install cython
+    python3 setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Cython is required for the native build: pip install cython")
+
+# Only importable library modules benefit. The top-level scripts
+# (test_lib.py, test_setup.py) are run as __main__ from their .py source,
+# so an extension built from them would never be loaded.
+COMPILED_MODULES = [
+    'lib/time_estimator.py',
+]
+
+setup(
+    name='weekly-planner-native',
+    packages=[],
+    py_modules=[],
+    ext_modules=cythonize(
+        COMPILED_MODULES,
+        compiler_directives={'language_level': 3},
+    ),
+)
@@ -5,19 +5,23 @@ This validates that the symlinked lib directory works correctly.
 """
 
 import sys
-import yaml
+from collections import Counter, defaultdict
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 # Add lib to path so we can import from it
-sys.path.insert(0, str(Path(__file__).parent / 'lib'))
+LIB_DIR = str(Path(__file__).parent / 'lib')
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
 
 from project_utils import load_config, get_priority_emoji
 
 def main():
     """Demonstrate loading and displaying project configuration."""
+    # Imported here so importing this module does not pull in rich/pygments
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+
     console = Console()
 
     console.print("\n[bold cyan]Weekly Planner - Library Integration Test[/bold cyan]\n")
@@ -42,13 +46,12 @@ def main():
         console.print("[red]No projects found in config![/red]")
         return 1
 
-    # Group projects by pillar
-    pillars = {}
+    # Group projects by pillar and count priorities in a single pass
+    pillars = defaultdict(list)
+    priorities = Counter()
     for project in projects:
-        pillar = project.get('pillar', 'unknown')
-        if pillar not in pillars:
-            pillars[pillar] = []
-        pillars[pillar].append(project)
+        pillars[project.get('pillar', 'unknown')].append(project)
+        priorities[project.get('priority')] += 1
 
     # Display summary by pillar
     for pillar, pillar_projects in pillars.items():
@@ -73,13 +76,16 @@ def main():
     # Test 3: Show configuration statistics
     console.print("[bold yellow]3. Configuration Statistics[/bold yellow]\n")
 
+    github = config.get('github') or {}
+    organizations = github.get('organizations') or []
+
     stats = {
         'Total Projects': len(projects),
-        'GitHub User': config.get('github', {}).get('user', 'Not set'),
-        'Organizations': len(config.get('github', {}).get('organizations', [])),
+        'GitHub User': github.get('user', 'Not set'),
+        'Organizations': len(organizations),
         'Pillars': len(pillars),
-        'Critical Priority': sum(1 for p in projects if p.get('priority') == 'critical'),
-        'High Priority': sum(1 for p in projects if p.get('priority') == 'high'),
+        'Critical Priority': priorities['critical'],
+        'High Priority': priorities['high'],
     }
 
     for key, value in stats.items():
@@ -107,6 +113,7 @@ if __name__ == '__main__':
         print("\n\nInterrupted by user")
         sys.exit(130)
     except Exception as e:
+        from rich.console import Console
         console = Console()
         console.print(f"\n[bold red]Error:[/bold red] {e}")
         import traceback
@@ -4,6 +4,7 @@ Test script to verify weekly-planner setup and dependencies.
 This validates that the repo is working and can be run.
 """
 
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -21,15 +22,18 @@ def check_dependencies():
         'pytz'
     ]
 
-    missing = []
-    installed = []
+    # find_spec locates each package without executing it, so heavy imports
+    # (gql, GitPython, rich) are not paid just to confirm they are installed.
+    # Packages that are already imported need no lookup at all.
+    loaded = frozenset(sys.modules)
+    found = {
+        package: importlib.util.find_spec(package)
+        for package in required_packages
+        if package not in loaded
+    }
 
-    for package in required_packages:
-        try:
-            __import__(package)
-            installed.append(package)
-        except ImportError:
-            missing.append(package)
+    missing = [package for package, spec in found.items() if spec is None]
+    installed = [package for package in required_packages if package not in missing]
 
     return installed, missing
 
@@ -44,8 +48,10 @@ def check_configuration():
     if config_file.exists():
         try:
             import yaml
-            with open(config_file) as f:
-                config = yaml.safe_load(f)
+            # Use libyaml's C loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            with open(config_file, 'rb') as f:
+                config = yaml.load(f, Loader=loader)
                 results['config.yaml'] = {
                     'exists': True,
                     'valid': True,
@@ -73,14 +79,16 @@ def check_lib_directory():
         return {'exists': False}
 
     target = lib_dir.resolve()
-    files = list(lib_dir.glob('*.py'))
+    # One directory scan; DirEntry caches file type, so no per-entry stat
+    with os.scandir(lib_dir) as entries:
+        names = [entry.name for entry in entries if entry.name.endswith('.py') and entry.is_file()]
 
     return {
         'exists': True,
         'is_symlink': lib_dir.is_symlink(),
         'target': str(target),
-        'accessible': len(files) > 0,
-        'files': [f.name for f in files]
+        'accessible': len(names) > 0,
+        'files': names
     }
 
 def main():
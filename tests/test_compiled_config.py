@@ -0,0 +1,127 @@
+"""
+Unit tests for the pre-compiled configuration module.
+
+Tests scripts/compile_config.py and how TimeEstimator picks between the
+compiled module and config.yaml.
+"""
+
+import hashlib
+import importlib
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add lib and scripts to path for imports (once, even when several test modules do this)
+_LIB_DIR = str(Path(__file__).parent.parent / "lib")
+_SCRIPTS_DIR = str(Path(__file__).parent.parent / "scripts")
+for _path in (_LIB_DIR, _SCRIPTS_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import time_estimator  # type: ignore
+from compile_config import compile_config  # type: ignore
+from project_utils import load_config  # type: ignore
+
+_MODULE_NAME = "_config_compiled"
+
+
+class TestLoadPlannerConfig(unittest.TestCase):
+    """Test that the compiled module is used only while it matches config.yaml."""
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self._saved_module = sys.modules.pop(_MODULE_NAME, None)
+        # Ahead of lib/, so a locally generated module never takes part.
+        sys.path.insert(0, self._tempdir.name)
+
+    def tearDown(self):
+        sys.path.remove(self._tempdir.name)
+        sys.modules.pop(_MODULE_NAME, None)
+        if self._saved_module is not None:
+            sys.modules[_MODULE_NAME] = self._saved_module
+        self._tempdir.cleanup()
+
+    def _write_module(self, digest):
+        """Write a compiled module with a recognisable config and ``digest``."""
+        module_path = Path(self._tempdir.name) / f"{_MODULE_NAME}.py"
+        module_path.write_text(
+            f"_SOURCE_SHA256 = {digest!r}\n"
+            "_CONFIG = {'weekly_planner': {'max_estimate_hours': 99}}\n"
+        )
+        importlib.invalidate_caches()
+
+    def test_matching_hash_returns_compiled_config(self):
+        """Test that a module recording config.yaml's hash is used as is."""
+        digest = hashlib.sha256(time_estimator.DEFAULT_CONFIG_PATH.read_bytes()).hexdigest()
+        self._write_module(digest)
+
+        config = time_estimator._load_planner_config(None)
+
+        assert config == {"weekly_planner": {"max_estimate_hours": 99}}
+
+    def test_stale_hash_falls_back_to_yaml(self):
+        """Test that a module compiled from another config.yaml is ignored."""
+        self._write_module("0" * 64)
+
+        config = time_estimator._load_planner_config(None)
+
+        assert config == load_config(time_estimator.DEFAULT_CONFIG_PATH)
+
+    def test_missing_module_falls_back_to_yaml(self):
+        """Test that config.yaml is loaded when no compiled module exists."""
+        sys.modules[_MODULE_NAME] = None  # Makes the import fail.
+
+        config = time_estimator._load_planner_config(None)
+
+        assert config == load_config(time_estimator.DEFAULT_CONFIG_PATH)
+
+    def test_custom_path_ignores_compiled_module(self):
+        """Test that an explicit config path never uses the compiled module."""
+        digest = hashlib.sha256(time_estimator.DEFAULT_CONFIG_PATH.read_bytes()).hexdigest()
+        self._write_module(digest)
+        config_path = Path(self._tempdir.name) / "config.yaml"
+        config_path.write_text("weekly_planner:\n  max_estimate_hours: 6\n")
+
+        config = time_estimator._load_planner_config(config_path)
+
+        assert config == {"weekly_planner": {"max_estimate_hours": 6}}
+
+
+class TestCompileConfig(unittest.TestCase):
+    """Test generating the compiled module."""
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self._tempdir.name) / "config.yaml"
+        self.output_path = Path(self._tempdir.name) / f"{_MODULE_NAME}.py"
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def test_writes_config_and_source_hash(self):
+        """Test that the generated module holds the parsed config and its hash."""
+        self.config_path.write_text("weekly_planner:\n  estimate_patterns: ['(\\d+)h']\n")
+
+        compile_config(self.config_path, self.output_path)
+
+        namespace = {}
+        exec(self.output_path.read_text(encoding="utf-8"), namespace)
+        assert namespace["_CONFIG"] == load_config(self.config_path)
+        assert namespace["_SOURCE_SHA256"] == hashlib.sha256(
+            self.config_path.read_bytes()
+        ).hexdigest()
+
+    def test_non_literal_values_raise(self):
+        """Test that values without a Python literal form raise ValueError."""
+        # YAML loads an unquoted date as datetime.date, which has no literal.
+        self.config_path.write_text("weekly_planner:\n  start: 2024-01-01\n")
+
+        with self.assertRaises(ValueError):
+            compile_config(self.config_path, self.output_path)
+
+        assert not self.output_path.exists()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
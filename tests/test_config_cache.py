@@ -0,0 +1,113 @@
+"""
+Unit tests for the config_cache pickle sidecar.
+
+Tests sidecar creation, reuse, and invalidation when the YAML changes.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add lib to path for imports (once, even when several test modules do this)
+_LIB_DIR = str(Path(__file__).parent.parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
+
+from config_cache import load_cached, sidecar_path  # type: ignore
+import project_utils  # type: ignore
+from project_utils import load_config  # type: ignore
+
+
+class TestConfigCache(unittest.TestCase):
+    """Test loading YAML through the pickle sidecar."""
+
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self._tempdir.name) / "config.yaml"
+        self.config_path.write_text("weekly_planner:\n  max_estimate_hours: 8\n")
+
+    def tearDown(self):
+        self._tempdir.cleanup()
+
+    def test_first_load_writes_sidecar(self):
+        """Test that parsing the YAML leaves a private sidecar behind."""
+        assert load_cached(self.config_path) == {"weekly_planner": {"max_estimate_hours": 8}}
+        assert sidecar_path(self.config_path).stat().st_mode & 0o777 == 0o600
+
+    def test_disabled_sidecar_writes_nothing(self):
+        """Test that sidecar=False only parses the YAML."""
+        assert load_cached(self.config_path, sidecar=False) == {
+            "weekly_planner": {"max_estimate_hours": 8}
+        }
+        assert not sidecar_path(self.config_path).exists()
+
+    def test_load_config_leaves_no_sidecar_outside_repo(self):
+        """Test that load_config writes nothing next to other config files."""
+        assert load_config(self.config_path) == {"weekly_planner": {"max_estimate_hours": 8}}
+        assert not sidecar_path(self.config_path).exists()
+
+    def test_fresh_sidecar_is_used(self):
+        """Test that a sidecar matching the source is returned without parsing."""
+        load_cached(self.config_path)
+        # Rewrite the value without changing size or mtime: only a sidecar
+        # hit can still return the original data.
+        stat = self.config_path.stat()
+        self.config_path.write_text("weekly_planner:\n  max_estimate_hours: 9\n")
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_cached(self.config_path) == {"weekly_planner": {"max_estimate_hours": 8}}
+
+    def test_load_config_replaces_entry_for_edited_file(self):
+        """Test that reloading an edited file keeps one cache entry for it."""
+        load_config(self.config_path)
+        entries = len(project_utils._CONFIG_CACHE)
+        stat = self.config_path.stat()
+        self.config_path.write_text("weekly_planner:\n  max_estimate_hours: 6\n")
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(self.config_path) == {"weekly_planner": {"max_estimate_hours": 6}}
+        assert len(project_utils._CONFIG_CACHE) == entries
+
+    def test_load_config_cache_is_bounded(self):
+        """Test that loading many files never grows the cache past its limit."""
+        for number in range(project_utils._CONFIG_CACHE_SIZE + 5):
+            path = Path(self._tempdir.name) / f"config{number}.yaml"
+            path.write_text(f"number: {number}\n")
+            assert load_config(path) == {"number": number}
+
+        assert len(project_utils._CONFIG_CACHE) == project_utils._CONFIG_CACHE_SIZE
+
+    def test_writable_sidecar_is_ignored(self):
+        """Test that a sidecar others could have written is never unpickled."""
+        load_cached(self.config_path)
+        stat = self.config_path.stat()
+        self.config_path.write_text("weekly_planner:\n  max_estimate_hours: 9\n")
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        sidecar_path(self.config_path).chmod(0o666)
+
+        assert load_cached(self.config_path) == {"weekly_planner": {"max_estimate_hours": 9}}
+
+    def test_stale_sidecar_is_ignored(self):
+        """Test that editing the YAML invalidates the sidecar."""
+        load_cached(self.config_path)
+        self.config_path.write_text("weekly_planner:\n  max_estimate_hours: 6\n")
+        stat = self.config_path.stat()
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_cached(self.config_path) == {"weekly_planner": {"max_estimate_hours": 6}}
+
+    def test_corrupt_sidecar_falls_back_to_yaml(self):
+        """Test that an unreadable sidecar is replaced by a fresh parse."""
+        sidecar_path(self.config_path).write_bytes(b"not a pickle")
+        assert load_cached(self.config_path) == {"weekly_planner": {"max_estimate_hours": 8}}
+
+    def test_missing_file_raises(self):
+        """Test that a missing YAML file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            load_cached(Path(self._tempdir.name) / "missing.yaml")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -4,17 +4,23 @@ Unit tests for TimeEstimator class.
 Tests pattern matching, edge cases, batch operations, and config integration.
 """
 
+import copy
+import functools
 import os
+import pickle
 import sys
 import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, Protocol, cast
 
 import yaml
 
-# Add lib to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+# Add lib to path for imports (once, even when several test modules do this)
+_LIB_DIR = str(Path(__file__).parent.parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
 
 from time_estimator import TimeEstimator  # type: ignore
 
@@ -26,7 +32,9 @@ class TimeEstimatorProtocol(Protocol):
         """Extract time estimate from issue body."""
         ...
 
-    def batch_extract(self, issues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def batch_extract(
+        self, issues: list[dict[str, Any]], *, workers: int = 1, in_place: bool = False
+    ) -> list[dict[str, Any]]:
         """Extract time estimates for multiple issues."""
         ...
 
@@ -46,8 +54,13 @@ class TimeEstimatorProtocol(Protocol):
         ...
 
 
+@functools.cache
 def _get_estimator() -> TimeEstimatorProtocol:
-    """Helper to create typed estimator instance."""
+    """Helper to get the shared typed estimator instance.
+
+    TimeEstimator keeps no per-call state, so a single instance (one config
+    load and one pattern compile) serves every test.
+    """
     return cast(TimeEstimatorProtocol, TimeEstimator())
 
 
@@ -118,6 +131,12 @@ class TestTimeEstimatorEdgeCases(unittest.TestCase):
         # "Estimate: 2h" should match before "Time: 3h" (pattern order)
         assert estimator.extract_estimate("Estimate: 2h Time: 3h") == 2
 
+    def test_pattern_order_beats_text_position(self):
+        """Test that an earlier pattern wins even if a later one appears first."""
+        estimator = _get_estimator()
+        assert estimator.extract_estimate("Time: 3h Estimate: 2h") == 2
+        assert estimator.extract_estimate("[4h] Effort: 6 hours") == 6
+
     def test_negative_value_becomes_absolute(self):
         """Test that negative values are converted to absolute value."""
         estimator = _get_estimator()
@@ -215,6 +234,12 @@ class TestTimeEstimatorBatchOperations(unittest.TestCase):
         assert results[1]["estimated_hours"] == 1  # Default
         assert results[2]["estimated_hours"] == 1  # Default
 
+    def test_batch_with_non_string_body(self):
+        """Test that non-string bodies fall back to the default."""
+        estimator = _get_estimator()
+        results = estimator.batch_extract([{"number": 1, "body": 42}])
+        assert results[0]["estimated_hours"] == 1
+
     def test_batch_with_mix_of_matched_unmatched(self):
         """Test batch with mix of matched and unmatched issues."""
         estimator = _get_estimator()
@@ -232,6 +257,129 @@ class TestTimeEstimatorBatchOperations(unittest.TestCase):
         assert results[2]["estimated_hours"] == 4
         assert results[3]["estimated_hours"] == 1  # Default
 
+    def test_batch_estimates_do_not_leak_between_issues(self):
+        """Test that a partial estimate never combines with the next issue."""
+        estimator = _get_estimator()
+        issues = [
+            {"number": 1, "body": "Estimate:"},
+            {"number": 2, "body": "3h"},
+            {"number": 3, "body": "[6h] Time: 2h"},
+            {"number": 4, "body": "Estimate: 5 hours"},
+        ]
+        results = estimator.batch_extract(issues)
+
+        assert [r["estimated_hours"] for r in results] == [
+            estimator.extract_estimate(issue["body"]) for issue in issues
+        ]
+        assert [r["estimated_hours"] for r in results] == [1, 1, 2, 5]
+
+    def test_batch_matches_per_issue_for_wildcard_patterns(self):
+        """Test that batch results equal extract_estimate for patterns using '.'."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "config.yaml"
+            config_path.write_text(yaml.dump({
+                'weekly_planner': {
+                    'estimate_patterns': ["(?i)e.*?(\\d+)h", "t(\\d+)"],
+                    'default_estimate_hours': 2,
+                    'max_estimate_hours': 50,
+                }
+            }))
+            estimator = TimeEstimator(config_path=config_path)
+
+        bodies = ["t1 E", "x", "e5h"]
+        results = estimator.batch_extract([{"body": body} for body in bodies])
+
+        assert [estimator.extract_estimate(body) for body in bodies] == [1, 2, 5]
+        assert [r["estimated_hours"] for r in results] == [1, 2, 5]
+
+    def test_batch_accepts_generator(self):
+        """Test that issues passed as a generator are all estimated."""
+        estimator = _get_estimator()
+        bodies = ["Estimate: 2h", None, "[4h]"]
+
+        results = estimator.batch_extract({"body": body} for body in bodies)
+
+        assert [r["estimated_hours"] for r in results] == [2, 1, 4]
+
+    def test_batch_with_workers_matches_serial(self):
+        """Test that parallel batch extraction returns the serial results."""
+        estimator = _get_estimator()
+        issues = [
+            {"number": n, "body": body}
+            for n, body in enumerate(
+                ["Estimate: 2h", "Time: 3h", None, "[4h]", "No estimate", "Effort: 12 hours"] * 5
+            )
+        ]
+        assert estimator.batch_extract(issues, workers=2) == estimator.batch_extract(issues)
+
+    def test_batch_rejects_invalid_workers(self):
+        """Test that a worker count below one raises ValueError."""
+        estimator = _get_estimator()
+        with self.assertRaises(ValueError):
+            estimator.batch_extract([], workers=0)
+
+    def test_batch_in_place_updates_input(self):
+        """Test that in_place adds estimates to the given dicts and list."""
+        estimator = _get_estimator()
+        issues = [{"number": 1, "body": "Estimate: 2 hours"}, {"number": 2, "body": None}]
+
+        results = estimator.batch_extract(issues, in_place=True)
+
+        assert results is issues
+        assert issues == [
+            {"number": 1, "body": "Estimate: 2 hours", "estimated_hours": 2},
+            {"number": 2, "body": None, "estimated_hours": 1},
+        ]
+
+    def test_batch_default_does_not_modify_input(self):
+        """Test that the default batch leaves the input dicts untouched."""
+        estimator = _get_estimator()
+        issues = [{"number": 1, "body": "Estimate: 2 hours"}]
+
+        results = estimator.batch_extract(issues)
+
+        assert results is not issues
+        assert issues == [{"number": 1, "body": "Estimate: 2 hours"}]
+
+    def test_batch_with_repeated_bodies(self):
+        """Test that duplicate bodies each get the right estimate."""
+        estimator = _get_estimator()
+        bodies = ["Estimate: 2h", "No estimate", "Estimate: 2h", None, "Time: 9h", "No estimate"]
+        results = estimator.batch_extract([{"body": body} for body in bodies])
+        assert [r["estimated_hours"] for r in results] == [2, 1, 2, 1, 8, 1]
+
+    def test_repeated_extract_uses_cached_result(self):
+        """Test that a repeat call for the same body is served from the cache."""
+        estimator = TimeEstimator()
+        body = "Some template text\n\nEstimate: 3 hours"
+
+        assert estimator.extract_estimate(body) == 3
+        first = estimator._estimator().cache_info()
+        assert estimator.extract_estimate(body) == 3
+        second = estimator._estimator().cache_info()
+
+        assert (first.hits, first.misses) == (0, 1)
+        assert (second.hits, second.misses) == (1, 1)
+
+    def test_used_estimator_can_be_pickled(self):
+        """Test that an estimator survives pickling and copying after use."""
+        estimator = TimeEstimator()
+        assert estimator.extract_estimate("Estimate: 3 hours") == 3
+
+        for clone in (pickle.loads(pickle.dumps(estimator)), copy.deepcopy(estimator)):
+            assert clone.extract_estimate("Estimate: 3 hours") == 3
+            assert (clone.default_hours, clone.max_hours) == (1, 8)
+            assert [p.pattern for p in clone.patterns] == [p.pattern for p in estimator.patterns]
+
+    def test_extract_estimate_in_process_pool(self):
+        """Test that a used estimator's bound method can be mapped in a process pool."""
+        estimator = TimeEstimator()
+        bodies = ["Estimate: 2h", None, "[4h]"]
+        expected = [estimator.extract_estimate(body) for body in bodies]
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert list(pool.map(estimator.extract_estimate, bodies)) == expected
+
     def test_empty_batch(self):
         """Test batch with empty list."""
         estimator = _get_estimator()
@@ -262,6 +410,38 @@ class TestTimeEstimatorBatchOperations(unittest.TestCase):
         assert results[0]["estimated_hours"] == 2
 
 
+class TestTimeEstimatorThreading(unittest.TestCase):
+    """Test using estimators from several threads at once."""
+
+    THREADS = 4
+
+    @staticmethod
+    def _estimate_concurrently(estimators: list[TimeEstimatorProtocol]) -> list[list[int]]:
+        """Estimate distinct long bodies with each estimator on its own thread."""
+        def work(numbered: tuple[int, TimeEstimatorProtocol]) -> list[int]:
+            thread, estimator = numbered
+            # Long, distinct bodies keep scans overlapping and bypass the memo cache.
+            return [
+                estimator.extract_estimate(f"{'filler ' * 2000}{thread}-{n} Estimate: 3 hours")
+                for n in range(50)
+            ]
+
+        with ThreadPoolExecutor(max_workers=len(estimators)) as pool:
+            return list(pool.map(work, enumerate(estimators)))
+
+    def test_one_estimator_across_threads(self):
+        """Test that a single estimator can be shared by parallel threads."""
+        estimator = TimeEstimator()
+        for estimates in self._estimate_concurrently([estimator] * self.THREADS):
+            assert estimates == [3] * 50
+
+    def test_separate_estimators_across_threads(self):
+        """Test that estimators sharing compiled patterns work in parallel threads."""
+        estimators = [TimeEstimator() for _ in range(self.THREADS)]
+        for estimates in self._estimate_concurrently(estimators):
+            assert estimates == [3] * 50
+
+
 class TestTimeEstimatorConfigIntegration(unittest.TestCase):
     """Test integration with actual config.yaml."""
 